@@ -18,6 +18,7 @@ Configuration (env vars, or CLI flags override):
     VERIFY_TLS         "false"/"0" to disable TLS verification (default: true)
     REQUEST_TIMEOUT    Per-request timeout seconds (default: 8)
     LOG_LEVEL          DEBUG|INFO|WARN|ERROR (default: INFO)
+    JELLYFIN_PUSH      "true"/"1" to listen on Jellyfin's WebSocket too (default: false)
 
 Run inside Docker (see Dockerfile and compose below).
 """
@@ -27,13 +28,48 @@ from __future__ import annotations
 import argparse
 import os
 import signal
+import ssl
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urlencode
 
+import certifi
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:  # faster JSON decoding when available
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:  # websocket-client, for Jellyfin push notifications
+    import websocket
+except ImportError:
+    websocket = None
+
+# Re-query the SAB queue once N poll intervals have passed; reuse it until then
+SAB_REFRESH_TICKS = 4
+
+# Upper bound (seconds) for the poll delay while requests keep failing
+BACKOFF_MAX = 300
+
+# Let Jellyfin drop sessions idle longer than this from /Sessions server-side
+JELLYFIN_ACTIVE_WITHIN = 60
+
+# With push connected and nothing to do, poll only this often (seconds)
+PUSH_IDLE_INTERVAL = 300
+
+# Send a Jellyfin KeepAlive over the socket at least this often (seconds)
+PUSH_KEEPALIVE = 30
+
+# Treat the push feed as down (and resubscribe) after this long without a
+# "Sessions" frame (seconds)
+PUSH_STALE_AFTER = 60
 
 
 @dataclass(frozen=True)
@@ -51,6 +87,7 @@ class Config:
         verify_tls: Verify TLS certificates on HTTPS endpoints.
         request_timeout: Per-HTTP-request timeout seconds.
         log_level: Log level name.
+        jellyfin_push: Listen on Jellyfin's WebSocket to react to playback changes.
     """
 
     jellyfin_url: str
@@ -63,45 +100,274 @@ class Config:
     verify_tls: bool = True
     request_timeout: int = 8
     log_level: str = "INFO"
+    jellyfin_push: bool = False
+
+
+@dataclass(frozen=True)
+class DerivedConfig:
+    """Request URLs, headers and params built once from a Config.
+
+    Attributes:
+        sessions_url: Jellyfin /Sessions endpoint.
+        socket_url: Jellyfin WebSocket endpoint, API key included.
+        sab_api_url: SABnzbd API endpoint.
+        jellyfin_headers: Headers sent with every Jellyfin request.
+        sab_pause_params: Query params for mode=pause.
+        sab_resume_params: Query params for mode=resume.
+        sab_queue_params: Query params for mode=queue.
+    """
+
+    sessions_url: str
+    socket_url: str
+    sab_api_url: str
+    jellyfin_headers: dict[str, str]
+    sab_pause_params: dict[str, str]
+    sab_resume_params: dict[str, str]
+    sab_queue_params: dict[str, str]
+
+
+def derive_config(cfg: Config) -> DerivedConfig:
+    """Precompute the per-request values that never change after startup."""
+    sab_api_url = f"{cfg.sab_url.rstrip('/')}/sabnzbd/api"
+    jellyfin_base = cfg.jellyfin_url.rstrip("/")
+    sessions_url = f"{jellyfin_base}/Sessions"
+    # http -> ws, https -> wss
+    socket_query = urlencode({"api_key": cfg.jellyfin_api_key, "deviceId": "debilarr"})
+    socket_url = f"ws{jellyfin_base[len('http'):]}/socket?{socket_query}"
+    # A long-paused client may stop reporting activity, so keep the full list
+    # when paused sessions count as watching
+    if not cfg.include_paused:
+        sessions_url += f"?activeWithinSeconds={JELLYFIN_ACTIVE_WITHIN}"
+    return DerivedConfig(
+        sessions_url=sessions_url,
+        socket_url=socket_url,
+        sab_api_url=sab_api_url,
+        jellyfin_headers={
+            "X-Emby-Token": cfg.jellyfin_api_key,
+            "Accept": "application/json",
+        },
+        sab_pause_params={"mode": "pause", "output": "json", "apikey": cfg.sab_api_key},
+        sab_resume_params={
+            "mode": "resume",
+            "output": "json",
+            "apikey": cfg.sab_api_key,
+        },
+        sab_queue_params={
+            "mode": "queue",
+            "output": "json",
+            "apikey": cfg.sab_api_key,
+        },
+    )
 
 
 class Logger:
-    """Minimal stdout logger with levels and timestamped output."""
+    """Minimal stdout logger with levels and timestamped output.
+
+    Lines go through the stdout buffer; WARN/ERROR (or any line on a TTY) are
+    flushed at once, the rest when the caller invokes flush().
+    """
 
     LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
 
     def __init__(self, level: str = "INFO") -> None:
         self._lvl = self.LEVELS.get(level.upper(), 20)
-
-    def _log(self, level: str, msg: str, **kv: Any) -> None:
-        if self.LEVELS[level] < self._lvl:
-            return
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Per-level switches so disabled calls return without a dict lookup
+        self.debug_on = self._lvl <= self.LEVELS["DEBUG"]
+        self.info_on = self._lvl <= self.LEVELS["INFO"]
+        self.warn_on = self._lvl <= self.LEVELS["WARN"]
+        self.error_on = self._lvl <= self.LEVELS["ERROR"]
+        # Timestamps only change once a second; format each second once
+        self._last_ts_epoch = 0
+        self._last_ts_str = ""
+        self._write = sys.stdout.write
+        self._flush = sys.stdout.flush
+        self._tty = sys.stdout.isatty()
+
+    def _log(self, level: str, msg: str, kv: dict[str, Any]) -> None:
+        now = int(time.time())
+        if now != self._last_ts_epoch:
+            self._last_ts_epoch = now
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        ts = self._last_ts_str
         extra = " ".join(f"{k}={v}" for k, v in kv.items())
-        line = f"{ts} {level} {msg}"
         if extra:
-            line += " | " + extra
-        print(line, flush=True)
+            self._write(f"{ts} {level} {msg} | {extra}\n")
+        else:
+            self._write(f"{ts} {level} {msg}\n")
+        if self._tty or level == "WARN" or level == "ERROR":
+            self._flush()
+
+    def flush(self) -> None:
+        self._flush()
 
     def debug(self, msg: str, **kv: Any) -> None:
-        self._log("DEBUG", msg, **kv)
+        if self.debug_on:
+            self._log("DEBUG", msg, kv)
 
     def info(self, msg: str, **kv: Any) -> None:
-        self._log("INFO", msg, **kv)
+        if self.info_on:
+            self._log("INFO", msg, kv)
 
     def warn(self, msg: str, **kv: Any) -> None:
-        self._log("WARN", msg, **kv)
+        if self.warn_on:
+            self._log("WARN", msg, kv)
 
     def error(self, msg: str, **kv: Any) -> None:
-        self._log("ERROR", msg, **kv)
+        if self.error_on:
+            self._log("ERROR", msg, kv)
+
+
+# ---------- HTTP ----------
+
+
+class SharedContextAdapter(HTTPAdapter):
+    """HTTPAdapter that verifies TLS with one preloaded, shared SSLContext.
+
+    The CA bundle is parsed once into the context instead of once per pool.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs: Any) -> None:
+        # Set before super().__init__, which builds the pool manager
+        self._ssl_context = ssl_context
+        self._ca_bundle = ca_bundle_path()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["ssl_context"] = self._ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any) -> None:
+        super().cert_verify(conn, url, verify, cert)
+        # Proxied pools come from proxy_manager_for and lack the shared context,
+        # so they must keep ca_certs or urllib3 falls back to the OS store
+        shared = getattr(conn, "conn_kw", {}).get("ssl_context") is self._ssl_context
+        if shared and (verify is True or verify == self._ca_bundle):
+            # Bundle is already loaded into the context; don't re-read it per
+            # connection
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+def ca_bundle_path() -> str:
+    """CA bundle requests would use: REQUESTS_CA_BUNDLE, CURL_CA_BUNDLE, certifi."""
+    return (
+        os.environ.get("REQUESTS_CA_BUNDLE")
+        or os.environ.get("CURL_CA_BUNDLE")
+        or certifi.where()
+    )
+
+
+def make_tls_context(cfg: Config) -> Optional[ssl.SSLContext]:
+    """Build the shared verifying SSLContext, or None when verification is off."""
+    if not cfg.verify_tls:
+        return None
+    bundle = ca_bundle_path()
+    if os.path.isdir(bundle):
+        return ssl.create_default_context(capath=bundle)
+    return ssl.create_default_context(cafile=bundle)
+
+
+def make_session(ssl_context: Optional[ssl.SSLContext] = None) -> requests.Session:
+    """Build a keep-alive session with a small connection pool and retries.
+
+    Polling runs forever, so reusing warm sockets avoids a TCP/TLS handshake
+    on every tick. When ssl_context is given, HTTPS uses it instead of a
+    per-pool context.
+    """
+    session = requests.Session()
+    adapter_kwargs: dict[str, Any] = dict(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+        ),
+    )
+    if ssl_context is not None:
+        adapter: HTTPAdapter = SharedContextAdapter(ssl_context, **adapter_kwargs)
+    else:
+        adapter = HTTPAdapter(**adapter_kwargs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@dataclass(frozen=True)
+class PreparedRequests:
+    """Fixed API requests, encoded once and replayed with Session.send.
+
+    Attributes:
+        sessions: Jellyfin /Sessions GET.
+        sab_queue: SABnzbd mode=queue GET.
+        sab_pause: SABnzbd mode=pause GET.
+        sab_resume: SABnzbd mode=resume GET.
+        jellyfin_send: Session.send kwargs for Jellyfin (timeout, verify, proxies).
+        sab_send: Session.send kwargs for SABnzbd (timeout, verify, proxies).
+    """
+
+    sessions: requests.PreparedRequest
+    sab_queue: requests.PreparedRequest
+    sab_pause: requests.PreparedRequest
+    sab_resume: requests.PreparedRequest
+    jellyfin_send: dict[str, Any]
+    sab_send: dict[str, Any]
+
+
+def prepare_requests(
+    cfg: Config,
+    derived: DerivedConfig,
+    jf_session: requests.Session,
+    sab_session: requests.Session,
+) -> PreparedRequests:
+    """Merge session headers and URL-encode params for every fixed request.
+
+    Session.send skips the environment lookup that Session.get does, so
+    HTTP(S)_PROXY, NO_PROXY and REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE are resolved
+    here once and replayed as send kwargs.
+    """
+
+    def send_kwargs(session: requests.Session, url: str) -> dict[str, Any]:
+        settings = session.merge_environment_settings(
+            url, {}, None, cfg.verify_tls, None
+        )
+        return {"timeout": cfg.request_timeout, **settings}
+
+    def sab(params: dict[str, str]) -> requests.PreparedRequest:
+        return sab_session.prepare_request(
+            requests.Request("GET", derived.sab_api_url, params=params)
+        )
+
+    return PreparedRequests(
+        sessions=jf_session.prepare_request(
+            requests.Request("GET", derived.sessions_url)
+        ),
+        sab_queue=sab(derived.sab_queue_params),
+        sab_pause=sab(derived.sab_pause_params),
+        sab_resume=sab(derived.sab_resume_params),
+        jellyfin_send=send_kwargs(jf_session, derived.sessions_url),
+        sab_send=send_kwargs(sab_session, derived.sab_api_url),
+    )
+
+
+def redact(text: str, secret: str) -> str:
+    """Mask an API key (raw or URL-encoded) in text bound for the log."""
+    if not secret:
+        return text
+    return text.replace(secret, "***").replace(quote_plus(secret), "***")
 
 
 # ---------- Jellyfin ----------
 
+# Last /Sessions validators and parsed body, keyed by URL, for conditional GETs
+_sessions_cache: dict[str, dict[str, Any]] = {}
+
 
 def jellyfin_active_playback(
-    cfg: Config, log: Logger
-) -> tuple[bool, list[dict[str, Any]]]:
+    cfg: Config,
+    prepared: PreparedRequests,
+    log: Logger,
+    session: requests.Session,
+    collect_details: bool,
+) -> tuple[Optional[bool], Optional[list[dict[str, Any]]]]:
     """Check if any Jellyfin session indicates active playback.
 
     A session counts as 'playing' when:
@@ -110,22 +376,54 @@ def jellyfin_active_playback(
       - PlayState.IsBuffering is False (or missing).
 
     If cfg.include_paused is True, then paused/buffering also count as 'watching'.
+    Returns None instead of a bool when the request fails. Per-session summaries
+    are only built when collect_details is True; otherwise the first watching
+    session decides and None is returned in their place.
     """
-    url = f"{cfg.jellyfin_url.rstrip('/')}/Sessions"
-    headers = {"X-Emby-Token": cfg.jellyfin_api_key, "Accept": "application/json"}
+    req = prepared.sessions
+    url = req.url
+    cached = _sessions_cache.get(url)
+    if cached:
+        req = req.copy()
+        if cached["etag"]:
+            req.headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            req.headers["If-Modified-Since"] = cached["last_modified"]
 
     try:
-        r = requests.get(
-            url, headers=headers, timeout=cfg.request_timeout, verify=cfg.verify_tls
-        )
-        r.raise_for_status()
-        sessions: list[dict[str, Any]] = r.json() or []
+        r = session.send(req, **prepared.jellyfin_send)
+        if r.status_code == 304 and cached:
+            sessions: list[dict[str, Any]] = cached["sessions"]
+        else:
+            r.raise_for_status()
+            sessions = _json.loads(r.content) or []
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+            if etag or last_modified:
+                _sessions_cache[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "sessions": sessions,
+                }
+            else:
+                _sessions_cache.pop(url, None)
     except Exception as e:
         log.error("Jellyfin sessions fetch failed", err=repr(e), url=url)
-        return False, []
+        return None, None
+
+    return summarize_sessions(sessions, cfg.include_paused, collect_details)
+
 
+def summarize_sessions(
+    sessions: list[dict[str, Any]], include_paused: bool, collect_details: bool
+) -> tuple[bool, Optional[list[dict[str, Any]]]]:
+    """Decide whether any session in a /Sessions-shaped list is being watched.
+
+    Without collect_details, returns at the first watching session and no
+    summaries are built.
+    """
     any_active = False
-    summaries: list[dict[str, Any]] = []
+    summaries: Optional[list[dict[str, Any]]] = [] if collect_details else None
 
     for s in sessions:
         now = s.get("NowPlayingItem")
@@ -133,14 +431,20 @@ def jellyfin_active_playback(
             continue
 
         ps = s.get("PlayState") or {}
-        is_paused = bool(ps.get("IsPaused", False) or ps.get("IsVideoPaused", False))
-        is_buffering = bool(ps.get("IsBuffering", False))
+        p, vp, buf = ps.get("IsPaused"), ps.get("IsVideoPaused"), ps.get("IsBuffering")
+        is_paused = bool(p or vp)
+        is_buffering = bool(buf)
 
         # Playing = we have an item, and it's neither paused nor buffering
         is_playing = (not is_paused) and (not is_buffering)
 
         # Effective decision:
-        watching = is_playing or (cfg.include_paused and (is_paused or is_buffering))
+        watching = is_playing or (include_paused and (is_paused or is_buffering))
+
+        if summaries is None:
+            if watching:
+                return True, None
+            continue
 
         summaries.append(
             {
@@ -160,21 +464,117 @@ def jellyfin_active_playback(
     return any_active, summaries
 
 
+def jellyfin_push_listener(
+    cfg: Config,
+    derived: DerivedConfig,
+    log: Logger,
+    wake: threading.Event,
+    stop: threading.Event,
+    connected: threading.Event,
+) -> None:
+    """Set `wake` when Jellyfin pushes a change in who is watching.
+
+    Subscribes to the "Sessions" feed on Jellyfin's WebSocket and judges each
+    pushed session like /Sessions. Only a change in the set of watching session
+    IDs wakes the poller, so progress updates don't, while a new playback still
+    does even if a stale session (e.g. a client that died mid-play) is listed.
+    `connected` is set only while "Sessions" frames are actually arriving; after
+    PUSH_STALE_AFTER seconds without one it is cleared and the feed is
+    resubscribed. Reconnects with backoff until `stop`.
+    """
+    if cfg.verify_tls:
+        sslopt = {"ca_certs": ca_bundle_path()}
+    else:
+        sslopt = {"cert_reqs": ssl.CERT_NONE}
+    fail_streak = 0
+
+    while not stop.is_set():
+        ws = None
+        watching: Optional[frozenset[Any]] = None
+        try:
+            ws = websocket.create_connection(
+                derived.socket_url, timeout=cfg.request_timeout, sslopt=sslopt
+            )
+            ws.send('{"MessageType":"SessionsStart","Data":"0,1500"}')
+            ws.settimeout(PUSH_KEEPALIVE)
+            last_sent = last_subscribed = last_frame = time.monotonic()
+            fail_streak = 0
+            log.info("Jellyfin push socket opened")
+
+            while not stop.is_set():
+                try:
+                    raw = ws.recv()
+                except websocket.WebSocketTimeoutException:
+                    raw = "{}"
+                if not raw:
+                    raise ConnectionError("closed by server")
+                msg = _json.loads(raw)
+                now = time.monotonic()
+
+                if msg.get("MessageType") == "Sessions":
+                    last_frame = now
+                    connected.set()
+                    ids = frozenset(
+                        s.get("Id")
+                        for s in msg.get("Data") or []
+                        if summarize_sessions([s], cfg.include_paused, False)[0]
+                    )
+                    if ids != watching:
+                        watching = ids
+                        log.debug("Jellyfin push: watchers changed", watching=len(ids))
+                        wake.set()
+
+                elif now - last_frame >= PUSH_STALE_AFTER:
+                    # Subscription went quiet; stop relying on it and ask again,
+                    # which makes Jellyfin push the current list right away
+                    connected.clear()
+                    if now - last_subscribed >= PUSH_STALE_AFTER:
+                        ws.send('{"MessageType":"SessionsStop"}')
+                        ws.send('{"MessageType":"SessionsStart","Data":"0,1500"}')
+                        last_subscribed = last_sent = now
+
+                if now - last_sent >= PUSH_KEEPALIVE:
+                    ws.send('{"MessageType":"KeepAlive"}')
+                    last_sent = now
+        except Exception as e:
+            fail_streak += 1
+            if isinstance(e, websocket.WebSocketBadStatusException):
+                err = f"handshake status {e.status_code}"
+            else:
+                err = redact(repr(e), cfg.jellyfin_api_key)
+            # Warn once per outage; an unreachable /socket would otherwise log
+            # on every reconnect
+            if fail_streak == 1:
+                log.warn("Jellyfin push disconnected", err=err)
+            else:
+                log.debug(
+                    "Jellyfin push still unavailable", err=err, attempts=fail_streak
+                )
+        finally:
+            connected.clear()
+            if ws is not None:
+                ws.close()
+
+        stop.wait(backoff_delay(cfg.interval, fail_streak))
+
+
 # ---------- SABnzbd ----------
 
 
-def sab_global_state(cfg: Config, log: Logger) -> dict:
+def sab_global_state(
+    cfg: Config, prepared: PreparedRequests, log: Logger, session: requests.Session
+) -> dict:
     """Return SABnzbd queue state; paused flag, speed (KB/s), and speedlimit percent."""
-    url = f"{cfg.sab_url.rstrip('/')}/sabnzbd/api"
-    params = {"mode": "queue", "output": "json", "apikey": cfg.sab_api_key}
+    # Logged on failure; drop the query string so the API key stays out of the
+    # url field (the error text is redacted separately)
+    url = prepared.sab_queue.url.split("?", 1)[0]
     try:
-        r = requests.get(
-            url, params=params, timeout=cfg.request_timeout, verify=cfg.verify_tls
-        )
+        r = session.send(prepared.sab_queue, **prepared.sab_send)
         r.raise_for_status()
-        data = r.json() or {}
+        data = _json.loads(r.content) or {}
     except Exception as e:
-        log.error("SABnzbd queue fetch failed", err=repr(e), url=url)
+        err = redact(repr(e), cfg.sab_api_key)
+        log.error("SABnzbd queue fetch failed", err=err, url=url)
         return {}
 
     q = data.get("queue") or {}
@@ -203,29 +603,41 @@ def sab_global_state(cfg: Config, log: Logger) -> dict:
     }
 
 
-def sab_set_pause(cfg: Config, log: Logger, pause: bool) -> bool:
-    """Pause or resume SABnzbd; returns True on HTTP OK."""
-    url = f"{cfg.sab_url.rstrip('/')}/sabnzbd/api"
+def sab_set_pause(
+    cfg: Config,
+    prepared: PreparedRequests,
+    log: Logger,
+    session: requests.Session,
+    pause: bool,
+) -> bool:
+    """Pause or resume SABnzbd; returns True once SAB reports {"status": true}."""
     mode = "pause" if pause else "resume"
     try:
-        r = requests.get(
-            url,
-            params={"mode": mode, "apikey": cfg.sab_api_key},
-            timeout=cfg.request_timeout,
-            verify=cfg.verify_tls,
+        r = session.send(
+            prepared.sab_pause if pause else prepared.sab_resume, **prepared.sab_send
         )
         r.raise_for_status()
+        if not (_json.loads(r.content) or {}).get("status"):
+            log.error("SABnzbd state change rejected", action=mode, body=r.text[:200])
+            return False
         log.info("SABnzbd state change requested", action=mode)
         return True
     except Exception as e:
-        log.error("SABnzbd state change failed", action=mode, err=repr(e))
+        err = redact(repr(e), cfg.sab_api_key)
+        log.error("SABnzbd state change failed", action=mode, err=err)
         return False
 
 
 # ---------- Loop ----------
 
 
-def run(cfg: Config) -> None:
+def backoff_delay(interval: int, fail_streak: int) -> int:
+    """Seconds to wait after `fail_streak` failed ticks; doubles up to a cap."""
+    cap = max(5 * interval, BACKOFF_MAX)
+    return min(interval * 2 ** min(fail_streak, 16), cap)
+
+
+def run(cfg: Config, derived: DerivedConfig) -> None:
     """Main polling loop; intended to run as PID 1 in the container."""
     log = Logger(cfg.log_level)
     log.info(
@@ -235,65 +647,143 @@ def run(cfg: Config) -> None:
         include_paused=cfg.include_paused,
     )
 
-    stop = {"flag": False}
+    # Separate sessions per host so each keeps its own warm connection pool,
+    # both verifying against one shared TLS context
+    tls_context = make_tls_context(cfg)
+    jf_session = make_session(tls_context)
+    jf_session.headers.update(derived.jellyfin_headers)
+    sab_session = make_session(tls_context)
+    prepared = prepare_requests(cfg, derived, jf_session, sab_session)
+
+    # Waiting on an event (not sleeping) lets a signal or a Jellyfin push end
+    # the wait immediately
+    stop = threading.Event()
+    wake = threading.Event()
+    push_connected = threading.Event()
 
     def _handler(signum, frame) -> None:
-        stop["flag"] = True
+        stop.set()
+        wake.set()
+        jf_session.close()
+        sab_session.close()
         log.info("Signal received, exiting", signum=signum)
 
     signal.signal(signal.SIGINT, _handler)
     signal.signal(signal.SIGTERM, _handler)
 
-    idle_accum = 0
+    if cfg.jellyfin_push and websocket is None:
+        log.warn("websocket-client not installed; Jellyfin push disabled")
+    elif cfg.jellyfin_push:
+        threading.Thread(
+            target=jellyfin_push_listener,
+            args=(cfg, derived, log, wake, stop, push_connected),
+            name="jellyfin-push",
+            daemon=True,
+        ).start()
+
+    idle_since: Optional[float] = None  # monotonic time playback was first seen idle
     last_state: Optional[bool] = None  # True=paused, False=running, None=unknown
-
-    while not stop["flag"]:
-        # 1. Query Jellyfin sessions
-        is_active, details = jellyfin_active_playback(cfg, log)
-        if log._lvl <= Logger.LEVELS["DEBUG"]:
+    sab_state: dict = {}  # last good queue state; empty forces a live query
+    sab_refresh_at = 0.0  # monotonic deadline for the next live queue query
+    fail_streak = 0  # consecutive ticks with a failed request
+
+    # The SAB queue fetch runs here so it overlaps the Jellyfin round-trip
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sab")
+
+    while not stop.is_set():
+        # Pushes arriving from here on trigger the next poll right away
+        wake.clear()
+
+        # 1. Start the SABnzbd state query (reuse the cached one between refreshes)
+        sab_future: Optional[Future[dict]] = None
+        # Time-based, so long push-idle waits don't stretch the refresh period
+        if not sab_state or time.monotonic() >= sab_refresh_at:
+            sab_future = pool.submit(sab_global_state, cfg, prepared, log, sab_session)
+            sab_refresh_at = time.monotonic() + SAB_REFRESH_TICKS * cfg.interval
+
+        # 2. Query Jellyfin sessions while SAB answers
+        jf_active, details = jellyfin_active_playback(
+            cfg, prepared, log, jf_session, log.debug_on
+        )
+        is_active = bool(jf_active)
+        if details:
             for d in details:
                 log.debug("Session", **d)
 
-        # 2. Query SABnzbd state
-        sab_state = sab_global_state(cfg, log)
+        if sab_future is not None:
+            sab_state = sab_future.result()
+
+        # Back off while either endpoint keeps failing
+        if jf_active is None or (sab_future is not None and not sab_state):
+            fail_streak += 1
+        else:
+            fail_streak = 0
+        delay = backoff_delay(cfg.interval, fail_streak)
+        if fail_streak:
+            log.warn("Request failed; backing off", failures=fail_streak, delay=delay)
+
         sab_paused = bool(sab_state.get("paused")) if sab_state else None
         sab_speedlimit_pct = sab_state.get("speedlimit_pct", 100) if sab_state else 100
 
         # 3. If Jellyfin active and SAB slider ≠ 100%, treat as override
         if is_active and sab_speedlimit_pct != 100:
-            idle_accum = 0
+            idle_since = None
             log.info(
                 "User override: SAB speed not at 100%, skipping auto-pause",
                 speedlimit_pct=sab_speedlimit_pct,
             )
-            time.sleep(cfg.interval)
+            log.flush()
+            wake.wait(delay)
             continue
 
         # 4. Auto-pause logic
         if is_active:
-            idle_accum = 0
+            idle_since = None
             if sab_paused is False or (sab_paused is None and last_state is not True):
-                sab_set_pause(cfg, log, pause=True)
+                # A confirmed change stands in for re-reading the queue next tick
+                if sab_set_pause(cfg, prepared, log, sab_session, pause=True):
+                    sab_state = {**sab_state, "paused": True} if sab_state else {}
+                else:
+                    sab_state = {}
                 last_state = True
                 log.info("Paused SAB due to active playback")
             else:
                 log.debug("Already paused; no action")
         else:
-            idle_accum += cfg.interval
-            log.debug("No active playback", idle_seconds=idle_accum)
-            if idle_accum >= cfg.resume_cooldown:
+            now = time.monotonic()
+            if idle_since is None:
+                idle_since = now
+            idle_seconds = int(now - idle_since)
+            log.debug("No active playback", idle_seconds=idle_seconds)
+            if idle_seconds >= cfg.resume_cooldown:
                 if sab_paused is not False:
-                    sab_set_pause(cfg, log, pause=False)
+                    if sab_set_pause(cfg, prepared, log, sab_session, pause=False):
+                        sab_state = {**sab_state, "paused": False} if sab_state else {}
+                    else:
+                        sab_state = {}
                     last_state = False
                     log.info("Idle threshold reached; resuming SAB")
                 else:
                     log.debug("Already running; no action")
 
-        time.sleep(cfg.interval)
+        # Nothing to do until playback starts, and the push will announce that
+        if (
+            push_connected.is_set()
+            and not is_active
+            and sab_paused is False
+            and not fail_streak
+        ):
+            delay = max(delay, PUSH_IDLE_INTERVAL)
 
+        log.flush()
+        wake.wait(delay)
 
-def parse_args() -> Config:
-    """Parse CLI args and environment variables into a Config."""
+    pool.shutdown(wait=False)
+    log.flush()
+
+
+def parse_args() -> tuple[Config, DerivedConfig]:
+    """Parse CLI args and environment variables into a Config and its derived values."""
     env = os.environ
 
     def env_bool(name: str, default: bool) -> bool:
@@ -330,6 +820,11 @@ def parse_args() -> Config:
         "--request-timeout", type=int, default=int(env.get("REQUEST_TIMEOUT", "8"))
     )
     p.add_argument("--log-level", default=env.get("LOG_LEVEL", "INFO"))
+    p.add_argument(
+        "--jellyfin-push",
+        action="store_true",
+        default=env_bool("JELLYFIN_PUSH", False),
+    )
     args = p.parse_args()
 
     missing = [
@@ -346,7 +841,7 @@ def parse_args() -> Config:
         print(f"ERROR Missing configuration: {', '.join(missing)}", file=sys.stderr)
         sys.exit(2)
 
-    return Config(
+    cfg = Config(
         jellyfin_url=args.jellyfin_url,
         jellyfin_api_key=args.jellyfin_api_key,
         sab_url=args.sab_url,
@@ -357,13 +852,15 @@ def parse_args() -> Config:
         verify_tls=args.verify_tls,
         request_timeout=args.request_timeout,
         log_level=args.log_level,
+        jellyfin_push=args.jellyfin_push,
     )
+    return cfg, derive_config(cfg)
 
 
 def main() -> None:
     """Entrypoint."""
-    cfg = parse_args()
-    run(cfg)
+    cfg, derived = parse_args()
+    run(cfg, derived)
 
 
 if __name__ == "__main__":